@@ -40,15 +40,21 @@ Generate sample files for offline testing:
     
     # Generate evolved schema sample file (30 records)
     python generate_logs.py --count 30 --evolved --output sample_logs_evolved.json
+
+Faster generation for large --count values (optional):
+    # Installs NumPy (batched random values) and orjson (faster serialization)
+    uv sync --extra fast
 """
 
 import argparse
 import json
 import os
-import random
 import sys
+import threading
 from datetime import datetime, timezone
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count as count_from
+from time import monotonic, sleep
 
 from dotenv import load_dotenv, find_dotenv
 try:
@@ -65,288 +71,57 @@ except ImportError:
     print("Install it with: pip install kafka-python")
     sys.exit(1)
 
+# orjson is optional: a faster json.dumps replacement that returns bytes directly
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(value):
+        # Compact separators match orjson and the pre-serialized INFO events
+        return json.dumps(value, separators=(',', ':')).encode('utf-8')
 
-# Sample data for generating realistic logs
-SERVICES = [
-    "web-api",
-    "auth-service",
-    "db-service",
-    "payment-service",
-    "inventory-service",
-    "notification-service",
-    "search-service",
-    "analytics-service"
-]
-
-HOSTS = {
-    "web-api": ["api-server-01", "api-server-02", "api-server-03"],
-    "auth-service": ["auth-server-01", "auth-server-02"],
-    "db-service": ["db-server-01"],
-    "payment-service": ["payment-server-01", "payment-server-02"],
-    "inventory-service": ["inventory-server-01", "inventory-server-02"],
-    "notification-service": ["notif-server-01"],
-    "search-service": ["search-server-01", "search-server-02"],
-    "analytics-service": ["analytics-server-01"]
-}
-
-LOG_LEVELS = {
-    "INFO": 0.70,    # 70% info logs
-    "WARN": 0.20,    # 20% warnings
-    "ERROR": 0.10    # 10% errors
-}
-
-INFO_MESSAGES = [
-    "Request processed successfully",
-    "User authentication successful",
-    "GET /api/v1/products",
-    "POST /api/v1/orders",
-    "PUT /api/v1/cart",
-    "DELETE /api/v1/cart/items",
-    "GET /api/v1/users/profile",
-    "Search query executed",
-    "Payment processed",
-    "Email notification sent",
-    "SMS notification sent",
-    "Daily report generated",
-    "Cache refreshed successfully",
-    "Session created",
-    "File uploaded successfully"
-]
-
-WARN_MESSAGES = [
-    "Query execution took longer than expected",
-    "Low stock alert for product SKU-12345",
-    "Multiple failed login attempts detected",
-    "Connection pool nearly exhausted",
-    "Payment declined",
-    "Rate limit approaching threshold",
-    "Memory usage above 80%",
-    "Disk space running low"
-]
-
-ERROR_MESSAGES = [
-    ("Database connection timeout", "ConnectionTimeout"),
-    ("Payment gateway timeout", "GatewayTimeout"),
-    ("Deadlock detected in transaction", "DeadlockDetected"),
-    ("Failed to update inventory count", "ConcurrencyException"),
-    ("Internal server error", "NullPointerException"),
-    ("Service unavailable", "ServiceUnavailable"),
-    ("Authentication failed", "AuthenticationError"),
-    ("Invalid input data", "ValidationError")
-]
-
-STATUS_CODES = {
-    "INFO": [200, 201, 204],
-    "WARN": [200, 402],
-    "ERROR": [500, 503, 504, 409]
-}
-
-
-def weighted_choice(choices):
-    """Select item based on weighted probabilities."""
-    items = list(choices.keys())
-    weights = list(choices.values())
-    return random.choices(items, weights=weights)[0]
-
-
-def generate_log_event(evolved=False):
-    """Generate a single log event with consistent schema.
-    
-    Args:
-        evolved: If True, add evolved fields for schema evolution demonstration
-    
-    Note:
-        This function now generates a consistent schema where all fields are always
-        present (set to None if not applicable). This ensures predictable table
-        schemas in Snowflake and accurate column counts for the quickstart demo.
-    """
-    # Select log level based on distribution
-    level = weighted_choice(LOG_LEVELS)
-    
-    # Select service and host
-    service = random.choice(SERVICES)
-    host = random.choice(HOSTS[service])
-    
-    # Generate base log structure with ALL base fields (11 total)
-    # Always initialize all base schema fields to ensure consistent schema
-    log = {
-        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        "level": level,
-        "service": service,
-        "host": host,
-        "request_id": f"req-{random.randbytes(4).hex()}",
-        "message": None,
-        "duration_ms": None,
-        "status_code": None,
-        "user_id": None,
-        "amount": None,
-        "error": None
-    }
-    
-    # Add level-specific content
-    if level == "INFO":
-        log["message"] = random.choice(INFO_MESSAGES)
-        log["duration_ms"] = random.randint(10, 500)
-        log["status_code"] = random.choice(STATUS_CODES["INFO"])
-        
-        # Add user_id conditionally but consistently
-        if random.random() < 0.7:  # 70% chance of user_id
-            log["user_id"] = f"user-{random.randint(10000, 99999)}"
-        
-        # Add amount for payment services
-        if random.random() < 0.3 and service == "payment-service":
-            log["amount"] = round(random.uniform(9.99, 999.99), 2)
-            
-    elif level == "WARN":
-        log["message"] = random.choice(WARN_MESSAGES)
-        log["status_code"] = random.choice(STATUS_CODES["WARN"])
-        
-        # Duration_ms may or may not be present for WARN
-        if random.random() < 0.5:
-            log["duration_ms"] = random.randint(500, 2000)
-        
-        # User_id may or may not be present for WARN
-        if random.random() < 0.4:
-            log["user_id"] = f"user-{random.randint(10000, 99999)}"
-            
-    else:  # ERROR
-        message, error_type = random.choice(ERROR_MESSAGES)
-        log["message"] = message
-        log["error"] = error_type
-        log["status_code"] = random.choice(STATUS_CODES["ERROR"])
-        log["duration_ms"] = random.randint(1000, 10000)
-    
-    # Add evolved fields for schema evolution demonstration
-    # Initialize ALL evolved fields (26 total) to ensure consistent schema
-    if evolved:
-        # Initialize all evolved fields as None first
-        evolved_fields = {
-            "region": None,
-            "trace_id": None,
-            "auth_method": None,
-            "provider": None,
-            "session_duration": None,
-            "currency": None,
-            "payment_method": None,
-            "retry_count": None,
-            "file_size_bytes": None,
-            "content_type": None,
-            "memory_percent": None,
-            "available_mb": None,
-            "disk_usage_percent": None,
-            "available_gb": None,
-            "query_params": None,
-            "result_count": None,
-            "recipient": None,
-            "smtp_code": None,
-            "metrics_count": None,
-            "time_window": None,
-            "product_id": None,
-            "rating": None,
-            "version": None,
-            "status": None,
-            "test": None,
-            "validation_errors": None
-        }
-        
-        # Add region to most logs
-        if random.random() < 0.8:
-            regions = ["us-east-1", "us-west-2", "us-central-1", "eu-west-1", "eu-central-1", "ap-south-1", "ap-northeast-1"]
-            evolved_fields["region"] = random.choice(regions)
-        
-        # Add trace_id occasionally
-        if random.random() < 0.3:
-            evolved_fields["trace_id"] = f"trace-{random.randbytes(8).hex()}"
-        
-        # Add auth-specific extended fields (higher probability for demo)
-        if service == "auth-service" and level == "INFO":
-            if random.random() < 0.9:  # Increased from 0.6 to ensure demo queries return data
-                evolved_fields["auth_method"] = random.choice(["oauth2", "saml", "basic", "api_key"])
-                evolved_fields["provider"] = random.choice(["google", "okta", "azure", "aws"])
-                if random.random() < 0.7:  # Increased from 0.5
-                    evolved_fields["session_duration"] = random.choice([1800, 3600, 7200])
-        
-        # Add payment-specific extended fields (higher probability for demo)
-        if service == "payment-service":
-            if log.get("amount") is not None or random.random() < 0.6:  # Ensure payment logs get these fields
-                if log.get("amount") is None:
-                    log["amount"] = round(random.uniform(9.99, 999.99), 2)
-                if random.random() < 0.9:  # Increased from 0.7 to ensure demo queries return data
-                    evolved_fields["currency"] = random.choice(["USD", "EUR", "GBP", "JPY"])
-                    evolved_fields["payment_method"] = random.choice(["credit_card", "debit_card", "paypal", "bank_transfer"])
-        
-        # Add retry count for errors
-        if level == "ERROR" and random.random() < 0.5:
-            evolved_fields["retry_count"] = random.randint(1, 5)
-        
-        # Add file upload fields for web-api (more scenarios)
-        if service == "web-api":
-            # Either the message contains "upload" OR randomly add for demo purposes
-            if "upload" in log.get("message", "").lower() or random.random() < 0.3:
-                evolved_fields["file_size_bytes"] = random.randint(10240, 10485760)  # 10KB to 10MB
-                evolved_fields["content_type"] = random.choice(["image/jpeg", "image/png", "application/pdf", "text/csv"])
-        
-        # Add system metrics for warnings
-        if level == "WARN" and ("memory" in log["message"].lower() or "disk" in log["message"].lower()):
-            if "memory" in log["message"].lower():
-                evolved_fields["memory_percent"] = round(random.uniform(80, 95), 1)
-                evolved_fields["available_mb"] = random.randint(256, 1024)
-            if "disk" in log["message"].lower():
-                evolved_fields["disk_usage_percent"] = random.randint(85, 98)
-                evolved_fields["available_gb"] = random.randint(10, 100)
-        
-        # Add query params for search/web services
-        if service in ["web-api", "search-service"] and random.random() < 0.3:
-            evolved_fields["query_params"] = {"category": random.choice(["electronics", "books", "clothing"]), "limit": random.choice([10, 25, 50, 100])}
-            evolved_fields["result_count"] = random.randint(0, evolved_fields["query_params"]["limit"])
-        
-        # Add notification-specific fields
-        if service == "notification-service" and level == "ERROR":
-            if random.random() < 0.5:
-                evolved_fields["recipient"] = f"user{random.randint(1000, 9999)}@example.com"
-                evolved_fields["smtp_code"] = random.choice([550, 554, 421])
-        
-        # Add analytics metrics
-        if service == "analytics-service" and "metrics" in log.get("message", "").lower():
-            if random.random() < 0.6:
-                evolved_fields["metrics_count"] = random.randint(100, 5000)
-                evolved_fields["time_window"] = random.choice(["1h", "4h", "24h"])
-        
-        # Add web-api specific fields occasionally
-        if service == "web-api" and random.random() < 0.2:
-            evolved_fields["product_id"] = f"prod-{random.randint(10000, 99999)}"
-            evolved_fields["rating"] = random.randint(1, 5)
-        
-        # Add version info occasionally
-        if random.random() < 0.15:
-            evolved_fields["version"] = random.choice(["1.0", "1.5", "2.0", "2.1"])
-        
-        # Add status field occasionally
-        if random.random() < 0.1:
-            evolved_fields["status"] = random.choice(["healthy", "degraded", "unhealthy"])
-        
-        # Add test flag occasionally
-        if random.random() < 0.05:
-            evolved_fields["test"] = True
-        
-        # Add validation errors for some ERROR logs
-        if level == "ERROR" and "validation" in log.get("message", "").lower():
-            evolved_fields["validation_errors"] = ["missing_field", "invalid_format"]
-        
-        # Merge evolved fields into log
-        log.update(evolved_fields)
-    
-    return log
+
+# Sample data pools and event generation
+from logs_fast import SERVICES, generate_log_events, generate_log_records, set_seed
+
+
+# Compression codecs whose libraries this project installs (gzip is in the stdlib)
+COMPRESSION_CODECS = ['none', 'gzip', 'lz4']
+
+# Broker acknowledgement settings accepted by --acks / KAFKA_ACKS
+ACKS_CHOICES = ['0', '1', 'all']
+
+# Minimum seconds between progress lines while generating or producing
+PROGRESS_INTERVAL = 0.5
+
+# Seconds between progress lines in --rate streaming mode
+STREAM_REPORT_INTERVAL = 5.0
+
+# Events generated per call to generate_log_records while streaming
+_STREAM_CHUNK = 10000
+
+# Message keys for each service, encoded once instead of on every send
+_SERVICE_KEYS = {service: service.encode('utf-8') for service in SERVICES}
 
 
 def create_producer(bootstrap_servers, security_protocol='PLAINTEXT', sasl_mechanism=None, 
-                    sasl_username=None, sasl_password=None):
-    """Create Kafka producer with optional SASL authentication."""
+                    sasl_username=None, sasl_password=None, linger_ms=50, batch_size=131072,
+                    compression_type='lz4', acks=1, max_in_flight=5):
+    """Create Kafka producer with optional SASL authentication.
+    
+    Batching (linger_ms, batch_size) and compression are tuned so that many
+    log events share a single produce request instead of one request each.
+    """
     config = {
         'bootstrap_servers': bootstrap_servers,
-        'value_serializer': lambda v: json.dumps(v).encode('utf-8'),
-        'key_serializer': lambda k: k.encode('utf-8') if k else None,
-        'security_protocol': security_protocol
+        'value_serializer': None,  # values are serialized before send, see produce_logs
+        'key_serializer': None,  # keys are passed as pre-encoded bytes
+        'security_protocol': security_protocol,
+        'linger_ms': linger_ms,
+        'batch_size': batch_size,
+        'compression_type': None if compression_type == 'none' else compression_type,
+        'acks': acks,
+        'max_in_flight_requests_per_connection': max_in_flight
     }
     
     # Add SASL configuration if using SASL-based security
@@ -376,6 +151,7 @@ def create_producer(bootstrap_servers, security_protocol='PLAINTEXT', sasl_mecha
         print("\nPlease verify your Kafka configuration:")
         print(f"  Brokers: {bootstrap_servers}")
         print(f"  Security Protocol: {security_protocol}")
+        print(f"  Compression: {compression_type}")
         if security_protocol in ['SASL_PLAINTEXT', 'SASL_SSL']:
             print(f"  SASL Mechanism: {sasl_mechanism}")
             print(f"  SASL Username: {sasl_username if sasl_username else '(not set)'}")
@@ -383,8 +159,15 @@ def create_producer(bootstrap_servers, security_protocol='PLAINTEXT', sasl_mecha
 
 
 def test_connection(bootstrap_servers, topic, security_protocol='PLAINTEXT', sasl_mechanism=None,
-                    sasl_username=None, sasl_password=None):
-    """Test connection to Kafka cluster and topic accessibility."""
+                    sasl_username=None, sasl_password=None, linger_ms=50, batch_size=131072,
+                    compression_type='lz4', acks=1, max_in_flight=5, keep_open=False):
+    """Test connection to Kafka cluster and topic accessibility.
+    
+    Returns a (success, producer) tuple. The producer is only returned (and
+    left open) when the test succeeds and keep_open is True, so the caller can
+    go on producing without a second connection handshake; otherwise it is
+    closed and None is returned in its place.
+    """
     print("\n" + "="*60)
     print("KAFKA CONNECTION TEST")
     print("="*60)
@@ -399,38 +182,24 @@ def test_connection(bootstrap_servers, topic, security_protocol='PLAINTEXT', sas
     
     try:
         producer = create_producer(bootstrap_servers, security_protocol, sasl_mechanism,
-                                  sasl_username, sasl_password)
+                                  sasl_username, sasl_password, linger_ms, batch_size,
+                                  compression_type, acks, max_in_flight)
         print("      ✓ Successfully connected to Kafka brokers")
     except Exception as e:
         print(f"      ✗ Failed to connect: {e}")
-        return False
+        return False, None
     
     # Test 2: Check cluster metadata
     print(f"\n[2/4] Fetching cluster metadata...")
+    partitions = None
+    metadata_error = None
     try:
-        # Give the producer a moment to fetch metadata
-        sleep(1)
-        
-        # Access cluster metadata through the producer
-        cluster = producer._metadata._partitions
-        
-        if cluster:
-            # Get unique brokers from metadata
-            brokers_found = set()
-            for topic_partitions in cluster.values():
-                for partition_metadata in topic_partitions.values():
-                    if hasattr(partition_metadata, 'leader'):
-                        brokers_found.add(partition_metadata.leader)
-            
-            if brokers_found:
-                print(f"      ✓ Cluster metadata retrieved")
-                print(f"      ✓ Found {len(brokers_found)} broker node(s): {sorted(brokers_found)}")
-            else:
-                print(f"      ✓ Connected to cluster (metadata available)")
-        else:
-            print(f"      ✓ Connected to cluster")
-            
+        # partitions_for() refreshes metadata for the topic in a single request.
+        # Returns None if topic doesn't exist, or a set of partition IDs if it does
+        partitions = producer.partitions_for(topic)
+        print(f"      ✓ Cluster metadata retrieved")
     except Exception as e:
+        metadata_error = e
         print(f"      ⚠ Could not fetch detailed metadata: {e}")
         print(f"      Note: This is not critical - connection was successful")
     
@@ -438,21 +207,14 @@ def test_connection(bootstrap_servers, topic, security_protocol='PLAINTEXT', sas
     print(f"\n[3/4] Checking topic accessibility...")
     print(f"      Topic: {topic}")
     
-    try:
-        # Use the public API to get partitions for the topic
-        # This will return None if topic doesn't exist, or a set of partition IDs if it does
-        partitions = producer.partitions_for(topic)
-        
-        if partitions is not None:
-            print(f"      ✓ Topic '{topic}' exists and is accessible")
-            print(f"      ✓ Topic has {len(partitions)} partition(s): {sorted(partitions)}")
-        else:
-            print(f"      ⚠ Topic '{topic}' not found in cluster")
-            print(f"      Note: Topic may be auto-created on first write (if broker allows auto-creation)")
-    except Exception as e:
-        print(f"      ⚠ Could not check topic: {e}")
-        import traceback
-        traceback.print_exc()
+    if metadata_error is not None:
+        print(f"      ⚠ Could not check topic: {metadata_error}")
+    elif partitions is not None:
+        print(f"      ✓ Topic '{topic}' exists and is accessible")
+        print(f"      ✓ Topic has {len(partitions)} partition(s): {sorted(partitions)}")
+    else:
+        print(f"      ⚠ Topic '{topic}' not found in cluster")
+        print(f"      Note: Topic may be auto-created on first write (if broker allows auto-creation)")
     
     # Test 4: Test write permissions (send a test message)
     print(f"\n[4/4] Testing write permissions...")
@@ -464,11 +226,15 @@ def test_connection(bootstrap_servers, topic, security_protocol='PLAINTEXT', sas
         }
         
         print(f"      Sending test message to topic '{topic}'...")
-        future = producer.send(topic, key="test", value=test_log)
+        future = producer.send(topic, key=b"test", value=_dumps(test_log))
         
-        # Wait for the message to be sent
+        # Wait for delivery with flush() rather than a blocking future.get(), the
+        # pattern that also keeps the batching in produce_logs effective
         try:
-            record_metadata = future.get(timeout=30)
+            producer.flush(timeout=30)
+            if not future.succeeded():
+                raise future.exception
+            record_metadata = future.value
             print(f"      ✓ Successfully sent test message")
             print(f"      ✓ Written to partition {record_metadata.partition} at offset {record_metadata.offset}")
         except Exception as send_error:
@@ -476,28 +242,32 @@ def test_connection(bootstrap_servers, topic, security_protocol='PLAINTEXT', sas
             import traceback
             traceback.print_exc()
             producer.close()
-            return False
+            return False, None
             
     except Exception as e:
         print(f"      ✗ Error preparing test message: {e}")
         import traceback
         traceback.print_exc()
         producer.close()
-        return False
-    
-    # Cleanup
-    producer.close()
+        return False, None
     
     # Summary
     print("\n" + "="*60)
     print("CONNECTION TEST RESULT: ✓ SUCCESS")
     print("="*60)
     print("\nYour Kafka configuration is working correctly!")
+    if keep_open:
+        print()
+        return True, producer
+    
+    # Cleanup
+    producer.close()
+    
     print(f"You can now produce logs with:")
     print(f"  python generate_logs.py --count 100")
     print()
     
-    return True
+    return True, None
 
 
 def write_logs_to_file(output_file, count, evolved=False):
@@ -507,12 +277,15 @@ def write_logs_to_file(output_file, count, evolved=False):
     
     try:
         with open(output_file, 'w') as f:
-            for i in range(count):
-                log = generate_log_event(evolved=evolved)
+            # Each event is written before the next one is generated, so templates can be reused
+            last_report = monotonic()
+            for i, log in enumerate(generate_log_events(count, evolved=evolved, reuse=True)):
                 f.write(json.dumps(log) + '\n')
                 
-                if (i + 1) % 10 == 0 or (i + 1) == count:
-                    print(f"  Generated {i + 1}/{count} events")
+                now = monotonic()
+                if now - last_report >= PROGRESS_INTERVAL or (i + 1) == count:
+                    last_report = now
+                    sys.stdout.write(f"  Generated {i + 1}/{count} events\n")
         
         print(f"✓ Successfully wrote {count} log events ({mode}) to {output_file}")
         print(f"\nYou can now produce these logs to Kafka with:")
@@ -523,39 +296,142 @@ def write_logs_to_file(output_file, count, evolved=False):
         sys.exit(1)
 
 
-def produce_logs(producer, topic, count, delay=0, evolved=False):
-    """Produce log events to Kafka topic."""
+def produce_logs(producer, topic, count, delay=0, evolved=False, flush=True, workers=1):
+    """Produce log events to Kafka topic.
+
+    Sends are asynchronous: progress and errors are reported from delivery
+    callbacks, and the final flush waits for all outstanding messages. Pass
+    flush=False to leave them buffered, e.g. when the caller keeps producing
+    and flushes once on shutdown.
+    
+    With workers > 1, events are generated and sent from that many threads
+    sharing the producer. Paced runs (delay > 0) always use a single thread.
+    """
     mode = "evolved schema" if evolved else "base schema"
     print(f"Producing {count} log events ({mode}) to topic '{topic}'...")
     
-    for i in range(count):
-        log = generate_log_event(evolved=evolved)
-        
-        # Use service as message key for partition distribution
-        key = log.get("service", "test")
-        
-        try:
-            # Send to Kafka
-            future = producer.send(topic, key=key, value=log)
+    # Shared across callbacks so progress stays correct if acks arrive out of order
+    acked = count_from(1)
+    last_report = [monotonic()]
+    
+    def _on_ack(record_metadata):
+        sent = next(acked)
+        now = monotonic()
+        if now - last_report[0] >= PROGRESS_INTERVAL or sent == count:
+            last_report[0] = now
+            sys.stdout.write(f"  Sent {sent}/{count} events (partition: {record_metadata.partition}, "
+                             f"offset: {record_metadata.offset})\n")
+    
+    def _on_err(i, exc):
+        print(f"Error sending message {i + 1}: {exc}")
+    
+    def _send_events(first, n, reuse):
+        start = monotonic()
+        for i, (service, event) in enumerate(generate_log_records(n, evolved=evolved, reuse=reuse), first):
+            # Use service as message key for partition distribution
+            key = _SERVICE_KEYS[service]
             
-            # Wait for send to complete (optional, for reliability)
-            record_metadata = future.get(timeout=10)
-            
-            if (i + 1) % 10 == 0 or (i + 1) == count:
-                print(f"  Sent {i + 1}/{count} events (partition: {record_metadata.partition}, offset: {record_metadata.offset})")
+            try:
+                # INFO events arrive pre-serialized; everything else is a dict
+                value = event if type(event) is bytes else _dumps(event)
+                
+                # Send to Kafka without blocking; the producer batches in the background
+                future = producer.send(topic, key=key, value=value)
+                future.add_callback(_on_ack)
+                future.add_errback(_on_err, i)
+                    
+            except Exception as e:
+                print(f"Error sending message {i + 1}: {e}")
             
-            # Optional delay between messages
+            # Optional delay between messages, scheduled against the start time so
+            # time spent sending does not stretch the period
             if delay > 0 and i < count - 1:
-                sleep(delay)
-                
-        except Exception as e:
-            print(f"Error sending message {i + 1}: {e}")
+                remaining = start + (i + 1 - first) * delay - monotonic()
+                sleep(remaining if remaining > 0 else 0)
+    
+    if workers <= 1 or delay > 0 or count < 2:
+        # Reusing event templates is safe because each event is serialized
+        # before the next one is generated
+        _send_events(0, count, reuse=True)
+    else:
+        # KafkaProducer is thread-safe; give each worker a contiguous range of
+        # events. Template dicts are shared module state, so workers don't reuse them.
+        workers = min(workers, count)
+        bounds = [count * w // workers for w in range(workers + 1)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            shards = [executor.submit(_send_events, lo, hi - lo, False)
+                      for lo, hi in zip(bounds, bounds[1:])]
+            for shard in shards:
+                shard.result()
+    
+    if not flush:
+        print(f"✓ Queued {count} log events ({mode})")
+        return
     
     # Flush to ensure all messages are sent
     producer.flush()
     print(f"✓ Successfully produced {count} log events ({mode})")
 
 
+def run_stream(producer, topic, rate_per_s, stop_event, evolved=False):
+    """Produce log events continuously at a steady rate until stop_event is set.
+    
+    Events are pulled from one endless generator and sent on a token-bucket
+    schedule: each send is due 1/rate_per_s seconds after the previous one,
+    and a sender that falls behind may catch up by at most one second's worth
+    of events. A rate_per_s of 0 sends as fast as possible. Nothing is flushed
+    here; the caller flushes once when it shuts the producer down.
+
+    Run it on a separate thread and set stop_event to stop it, as main does
+    on Ctrl+C.
+    """
+    mode = "evolved schema" if evolved else "base schema"
+    rate_desc = f"{rate_per_s:g} events/s" if rate_per_s > 0 else "unthrottled"
+    print(f"Streaming log events ({mode}, {rate_desc}) to topic '{topic}' (Ctrl+C to stop)...")
+    
+    def _on_err(exc):
+        print(f"Error sending message: {exc}")
+    
+    def _event_stream():
+        while True:
+            yield from generate_log_records(_STREAM_CHUNK, evolved=evolved, reuse=True)
+    
+    period = 1 / rate_per_s if rate_per_s > 0 else 0
+    burst = max(period, 1.0) if period else 0
+    sent = 0
+    next_send = last_report = monotonic()
+    
+    events = _event_stream()
+    while not stop_event.is_set():
+        if period:
+            now = monotonic()
+            if next_send > now:
+                # Waiting on the event keeps shutdown responsive between sends
+                if stop_event.wait(next_send - now):
+                    break
+            elif now - next_send > burst:
+                next_send = now - burst
+            next_send += period
+        
+        # Generate only once the send is due so the timestamp matches the send time.
+        # Reusing event templates is safe because each event is serialized
+        # before the next one is generated.
+        service, event = next(events)
+        value = event if type(event) is bytes else _dumps(event)
+        try:
+            producer.send(topic, key=_SERVICE_KEYS[service], value=value).add_errback(_on_err)
+        except Exception as e:
+            print(f"Error sending message: {e}")
+        
+        sent += 1
+        now = monotonic()
+        if now - last_report >= STREAM_REPORT_INTERVAL:
+            last_report = now
+            sys.stdout.write(f"  Sent {sent} events\n")
+    
+    print(f"✓ Streamed {sent} log events ({mode})")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate sample application logs and produce them to Kafka',
@@ -569,6 +445,9 @@ Examples:
   # Test connection to Kafka (recommended first step)
   python generate_logs.py --brokers localhost:9092 --topic application-logs --test-connection
   
+  # Test the connection, then produce 50 logs over the same connection
+  python generate_logs.py --brokers localhost:9092 --topic application-logs --test-connection --count 50
+  
   # Produce 50 logs to local Kafka
   python generate_logs.py --brokers localhost:9092 --topic application-logs --count 50
   
@@ -578,6 +457,9 @@ Examples:
   # Continuous production (run until Ctrl+C)
   python generate_logs.py --brokers localhost:9092 --topic logs --count 10 --continuous
   
+  # Stream a steady 200 events per second (run until Ctrl+C)
+  python generate_logs.py --brokers localhost:9092 --topic logs --rate 200
+  
   # Using environment variables
   export KAFKA_BROKERS=localhost:9092 KAFKA_TOPIC=logs
   python generate_logs.py --test-connection
@@ -590,6 +472,11 @@ Environment Variables:
   KAFKA_SASL_MECHANISM    SASL mechanism (required for SASL_* protocols)
   KAFKA_SASL_USERNAME     SASL username (required for PLAIN, SCRAM-*)
   KAFKA_SASL_PASSWORD     SASL password (required for PLAIN, SCRAM-*)
+  KAFKA_LINGER_MS         Producer batching delay in ms (default: 50)
+  KAFKA_BATCH_SIZE        Producer batch size in bytes (default: 131072)
+  KAFKA_COMPRESSION_TYPE  Producer compression codec (default: lz4)
+  KAFKA_ACKS              Producer acknowledgements: 0, 1 or all (default: 1)
+  KAFKA_MAX_IN_FLIGHT     Max unacknowledged requests per broker connection (default: 5)
         """
     )
     
@@ -606,7 +493,7 @@ Environment Variables:
     parser.add_argument(
         '--count',
         type=int,
-        default=10,
+        default=None,
         help='Number of log events to produce (default: 10)'
     )
     parser.add_argument(
@@ -615,6 +502,20 @@ Environment Variables:
         default=0,
         help='Delay in seconds between messages (default: 0)'
     )
+    parser.add_argument(
+        '--rate',
+        type=float,
+        help='Stream events continuously at this many messages per second until Ctrl+C '
+             '(0 for as fast as possible). Cannot be combined with --count, --delay, --continuous, '
+             '--workers or --output.'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of threads generating and sending events through the shared producer (default: 1). '
+             'Cannot be combined with --delay.'
+    )
     parser.add_argument(
         '--continuous',
         action='store_true',
@@ -642,22 +543,85 @@ Environment Variables:
         default=os.environ.get('KAFKA_SASL_PASSWORD'),
         help='SASL password (required for PLAIN, SCRAM-*). Can be set via KAFKA_SASL_PASSWORD env var.'
     )
+    parser.add_argument(
+        '--linger-ms',
+        type=int,
+        default=os.environ.get('KAFKA_LINGER_MS', '50'),
+        help='Time in ms the producer waits to fill a batch before sending (default: 50). Can be set via KAFKA_LINGER_MS env var.'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=os.environ.get('KAFKA_BATCH_SIZE', '131072'),
+        help='Maximum producer batch size in bytes per partition (default: 131072). Can be set via KAFKA_BATCH_SIZE env var.'
+    )
+    parser.add_argument(
+        '--compression',
+        default=os.environ.get('KAFKA_COMPRESSION_TYPE', 'lz4'),
+        choices=COMPRESSION_CODECS,
+        help='Compression codec for produced batches (default: lz4). Can be set via KAFKA_COMPRESSION_TYPE env var.'
+    )
+    parser.add_argument(
+        '--acks',
+        default=os.environ.get('KAFKA_ACKS', '1'),
+        choices=ACKS_CHOICES,
+        help='Broker acknowledgements required per request (default: 1). Can be set via KAFKA_ACKS env var.'
+    )
+    parser.add_argument(
+        '--max-in-flight',
+        type=int,
+        default=os.environ.get('KAFKA_MAX_IN_FLIGHT', '5'),
+        help='Max unacknowledged requests per broker connection (default: 5). Values above 1 keep more batches '
+             'in flight but let retries reorder messages, which is fine for log ingest; use 1 for strict ordering. '
+             'Can be set via KAFKA_MAX_IN_FLIGHT env var.'
+    )
     parser.add_argument(
         '--test-connection',
         action='store_true',
-        help='Test Kafka connection and exit (no logs produced)'
+        help='Test Kafka connection and exit (no logs produced). Combined with --count, '
+             'produces logs over the tested connection after a successful test'
     )
     parser.add_argument(
         '--evolved',
         action='store_true',
         help='Generate logs with evolved fields for schema evolution demonstration'
     )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Random seed for reproducible log content (timestamps still use the current time)'
+    )
     parser.add_argument(
         '--output',
         help='Output file path (JSONL format). If specified, writes to file instead of Kafka. Brokers and topic are not required when using --output.'
     )
     
     args = parser.parse_args()
+    # Env var defaults bypass argparse choices, so check them explicitly
+    if args.compression not in COMPRESSION_CODECS:
+        parser.error(f"--compression must be one of {', '.join(COMPRESSION_CODECS)} (got '{args.compression}')")
+    if args.acks not in ACKS_CHOICES:
+        parser.error(f"--acks must be one of {', '.join(ACKS_CHOICES)} (got '{args.acks}')")
+    acks = args.acks if args.acks == 'all' else int(args.acks)
+    
+    if args.workers < 1:
+        parser.error("--workers must be 1 or greater")
+    if args.workers > 1 and args.delay > 0:
+        parser.error("--delay paces a single thread and cannot be combined with --workers")
+    
+    if args.rate is not None:
+        if args.rate < 0:
+            parser.error("--rate must be 0 or greater")
+        if args.output:
+            parser.error("--rate streams to Kafka and cannot be combined with --output")
+        if args.continuous:
+            parser.error("--rate already streams continuously and cannot be combined with --continuous")
+        if args.count is not None:
+            parser.error("--rate streams until stopped and cannot be combined with --count")
+        if args.delay > 0:
+            parser.error("--rate sets the pacing and cannot be combined with --delay")
+        if args.workers > 1:
+            parser.error("--rate uses a single stream thread and cannot be combined with --workers")
     
     # Validate required arguments (skip for --output mode)
     if not args.output:
@@ -667,51 +631,97 @@ Environment Variables:
             parser.error("--topic is required (or set KAFKA_TOPIC environment variable)")
     
     # Handle connection test mode
+    producer = None
     if args.test_connection:
         if not args.brokers or not args.topic:
             parser.error("--test-connection requires --brokers and --topic")
-        success = test_connection(
+        # Keep the tested connection open when --count asks to produce afterwards
+        success, producer = test_connection(
             args.brokers, 
             args.topic, 
             args.security_protocol,
             args.sasl_mechanism,
             args.sasl_username,
-            args.sasl_password
+            args.sasl_password,
+            args.linger_ms,
+            args.batch_size,
+            args.compression,
+            acks,
+            args.max_in_flight,
+            keep_open=(args.count is not None or args.rate is not None) and not args.output
         )
-        sys.exit(0 if success else 1)
+        if producer is None:
+            sys.exit(0 if success else 1)
+    
+    if args.count is None:
+        args.count = 10
+    
+    if args.seed is not None:
+        set_seed(args.seed)
     
     # Handle file output mode
     if args.output:
         write_logs_to_file(args.output, args.count, args.evolved)
         sys.exit(0)
     
-    # Create producer for Kafka mode
-    print(f"Connecting to Kafka brokers: {args.brokers}")
-    producer = create_producer(
-        args.brokers, 
-        args.security_protocol,
-        args.sasl_mechanism,
-        args.sasl_username,
-        args.sasl_password
-    )
-    print("✓ Connected to Kafka")
+    # Create producer for Kafka mode, unless the connection test already opened one
+    if producer is None:
+        print(f"Connecting to Kafka brokers: {args.brokers}")
+        producer = create_producer(
+            args.brokers, 
+            args.security_protocol,
+            args.sasl_mechanism,
+            args.sasl_username,
+            args.sasl_password,
+            args.linger_ms,
+            args.batch_size,
+            args.compression,
+            acks,
+            args.max_in_flight
+        )
+        print("✓ Connected to Kafka")
     
     try:
-        if args.continuous:
+        if args.rate is not None:
+            # Stream from a worker thread so Ctrl+C can stop it via the event and
+            # let the current send finish before the producer is flushed and closed
+            stop_event = threading.Event()
+            stream_done = threading.Event()
+            
+            def _stream():
+                try:
+                    run_stream(producer, args.topic, args.rate, stop_event, args.evolved)
+                finally:
+                    stream_done.set()
+            
+            threading.Thread(target=_stream, name='log-stream', daemon=True).start()
+            try:
+                while not stream_done.wait(0.5):
+                    pass
+            except KeyboardInterrupt:
+                # Thread.join() is unreliable once interrupted, so wait on the
+                # completion event instead
+                stop_event.set()
+                stream_done.wait()
+                raise
+        elif args.continuous:
             print(f"Running in continuous mode (Ctrl+C to stop)")
             iteration = 1
             while True:
                 print(f"\n--- Iteration {iteration} ---")
-                produce_logs(producer, args.topic, args.count, args.delay, args.evolved)
+                produce_logs(producer, args.topic, args.count, args.delay, args.evolved, flush=False,
+                             workers=args.workers)
                 print("Sleeping 5 seconds before next batch...")
                 sleep(5)
                 iteration += 1
         else:
-            produce_logs(producer, args.topic, args.count, args.delay, args.evolved)
+            produce_logs(producer, args.topic, args.count, args.delay, args.evolved, workers=args.workers)
             
     except KeyboardInterrupt:
         print("\n\nStopped by user (Ctrl+C)")
     finally:
+        # Streaming and continuous modes skip per-batch flushes, so deliver anything still buffered
+        producer.flush()
         producer.close()
         print("✓ Producer closed")
 
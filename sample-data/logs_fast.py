@@ -0,0 +1,500 @@
+"""
+Log event generation for generate_logs.py
+
+Holds the sample data pools and the per-event generation hot path, kept
+separate from the Kafka and CLI handling in generate_logs.py.
+"""
+
+import json
+import random
+from datetime import datetime, timezone
+from itertools import accumulate
+from time import time_ns
+from typing import Any, Iterator, cast
+
+# NumPy is optional: when available, random values are drawn in batches
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+# Sample data for generating realistic logs
+SERVICES: list[str] = [
+    "web-api",
+    "auth-service",
+    "db-service",
+    "payment-service",
+    "inventory-service",
+    "notification-service",
+    "search-service",
+    "analytics-service"
+]
+
+HOSTS: dict[str, list[str]] = {
+    "web-api": ["api-server-01", "api-server-02", "api-server-03"],
+    "auth-service": ["auth-server-01", "auth-server-02"],
+    "db-service": ["db-server-01"],
+    "payment-service": ["payment-server-01", "payment-server-02"],
+    "inventory-service": ["inventory-server-01", "inventory-server-02"],
+    "notification-service": ["notif-server-01"],
+    "search-service": ["search-server-01", "search-server-02"],
+    "analytics-service": ["analytics-server-01"]
+}
+
+LOG_LEVELS: dict[str, float] = {
+    "INFO": 0.70,    # 70% info logs
+    "WARN": 0.20,    # 20% warnings
+    "ERROR": 0.10    # 10% errors
+}
+
+INFO_MESSAGES: list[str] = [
+    "Request processed successfully",
+    "User authentication successful",
+    "GET /api/v1/products",
+    "POST /api/v1/orders",
+    "PUT /api/v1/cart",
+    "DELETE /api/v1/cart/items",
+    "GET /api/v1/users/profile",
+    "Search query executed",
+    "Payment processed",
+    "Email notification sent",
+    "SMS notification sent",
+    "Daily report generated",
+    "Cache refreshed successfully",
+    "Session created",
+    "File uploaded successfully"
+]
+
+WARN_MESSAGES: list[str] = [
+    "Query execution took longer than expected",
+    "Low stock alert for product SKU-12345",
+    "Multiple failed login attempts detected",
+    "Connection pool nearly exhausted",
+    "Payment declined",
+    "Rate limit approaching threshold",
+    "Memory usage above 80%",
+    "Disk space running low"
+]
+
+ERROR_MESSAGES: list[tuple[str, str]] = [
+    ("Database connection timeout", "ConnectionTimeout"),
+    ("Payment gateway timeout", "GatewayTimeout"),
+    ("Deadlock detected in transaction", "DeadlockDetected"),
+    ("Failed to update inventory count", "ConcurrencyException"),
+    ("Internal server error", "NullPointerException"),
+    ("Service unavailable", "ServiceUnavailable"),
+    ("Authentication failed", "AuthenticationError"),
+    ("Invalid input data", "ValidationError")
+]
+
+STATUS_CODES: dict[str, list[int]] = {
+    "INFO": [200, 201, 204],
+    "WARN": [200, 402],
+    "ERROR": [500, 503, 504, 409]
+}
+
+
+# Private RNG whose bound methods are kept as module globals, saving an attribute
+# lookup on every call in the hot path. Seed it with set_seed() for repeatable runs.
+_rng = random.Random()
+_random = _rng.random
+_choice = _rng.choice
+_randint = _rng.randint
+_uniform = _rng.uniform
+_getrandbits = _rng.getrandbits
+
+# Services and their hosts as parallel tuples, indexed by service position
+_SERVICES_T: tuple[str, ...] = tuple(SERVICES)
+_HOSTS_T: tuple[tuple[str, ...], ...] = tuple(tuple(HOSTS[service]) for service in SERVICES)
+
+# Cumulative LOG_LEVELS distribution, computed once instead of on every event
+_LEVEL_ITEMS: tuple[str, ...] = tuple(LOG_LEVELS)
+_LEVEL_CUM: tuple[float, ...] = tuple(accumulate(LOG_LEVELS.values()))
+_LEVEL_TABLE: tuple[tuple[str, float], ...] = tuple(zip(_LEVEL_ITEMS, _LEVEL_CUM))
+
+# Per-level pools and duration ranges used by batched generation
+_LEVEL_MESSAGES: dict[str, list[str] | list[tuple[str, str]]] = {"INFO": INFO_MESSAGES, "WARN": WARN_MESSAGES, "ERROR": ERROR_MESSAGES}
+_LEVEL_DURATIONS: dict[str, tuple[int, int]] = {"INFO": (10, 500), "WARN": (500, 2000), "ERROR": (1000, 10000)}
+
+if np is not None:
+    _np_rng = np.random.default_rng()
+    _NP_BATCH_SIZE = 10000
+    _NP_LEVEL_P = np.array([LOG_LEVELS[level] for level in _LEVEL_ITEMS]) / _LEVEL_CUM[-1]
+    _NP_HOST_COUNTS = np.array([len(HOSTS[service]) for service in SERVICES])
+    _NP_MESSAGE_COUNTS = np.array([len(_LEVEL_MESSAGES[level]) for level in _LEVEL_ITEMS])
+    _NP_STATUS_COUNTS = np.array([len(STATUS_CODES[level]) for level in _LEVEL_ITEMS])
+    _NP_DURATION_LOW = np.array([_LEVEL_DURATIONS[level][0] for level in _LEVEL_ITEMS])
+    _NP_DURATION_HIGH = np.array([_LEVEL_DURATIONS[level][1] + 1 for level in _LEVEL_ITEMS])
+
+
+# JSON fragments for serializing base schema INFO events without building a dict.
+# Each head continues a "timestamp" value and opens the "request_id" value.
+_INFO_HEADS: tuple[tuple[str, ...], ...] = tuple(
+    tuple(f'","level":"INFO","service":{json.dumps(service)},"host":{json.dumps(host)},"request_id":"req-'
+          for host in HOSTS[service])
+    for service in SERVICES
+)
+_INFO_MESSAGES_JSON: tuple[str, ...] = tuple(json.dumps(message) for message in INFO_MESSAGES)
+
+# One reusable event dict per (level, evolved) pair, see generate_log_event(reuse=True)
+_LOG_TEMPLATES: dict[tuple[str, bool], dict[str, Any]] = {(level, evolved): {} for level in LOG_LEVELS for evolved in (False, True)}
+
+# Last formatted timestamp as (epoch milliseconds, ISO-8601 string). Replaced as
+# a whole tuple so concurrent callers never see a mismatched pair.
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string with millisecond precision.
+    
+    Events produced within the same millisecond reuse the cached string.
+    """
+    global _ts_cache
+    ms: int = time_ns() // 1_000_000
+    cached: tuple[int, str] = _ts_cache
+    if cached[0] == ms:
+        return cached[1]
+    iso: str = (datetime.fromtimestamp(ms // 1000, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.")
+                + f"{ms % 1000:03d}Z")
+    _ts_cache = (ms, iso)
+    return iso
+
+
+def set_seed(seed: int) -> None:
+    """Seed the random generators used for log events so runs are repeatable.
+    
+    Timestamps still reflect the wall clock, and runs with more than one
+    worker thread interleave draws nondeterministically.
+    """
+    global _np_rng
+    _rng.seed(seed)
+    if np is not None:
+        _np_rng = np.random.default_rng(seed)
+
+
+def choose_level() -> str:
+    """Select a log level based on the LOG_LEVELS distribution."""
+    r: float = _random() * _LEVEL_CUM[-1]
+    for level, cum in _LEVEL_TABLE:
+        if r < cum:
+            return level
+    return _LEVEL_ITEMS[-1]
+
+
+def generate_log_event(evolved: bool = False, reuse: bool = False, level: str | None = None) -> dict[str, Any]:
+    """Generate a single log event with consistent schema.
+    
+    Args:
+        evolved: If True, add evolved fields for schema evolution demonstration
+        reuse: If True, fill and return a shared per-level template dict instead
+            of allocating a new one. The result is only valid until the next
+            call with reuse=True, so it must be serialized before then.
+        level: Log level to generate; drawn from LOG_LEVELS when omitted
+    
+    Note:
+        This function now generates a consistent schema where all fields are always
+        present (set to None if not applicable). This ensures predictable table
+        schemas in Snowflake and accurate column counts for the quickstart demo.
+    """
+    # Select log level based on distribution
+    if level is None:
+        level = choose_level()
+    
+    log: dict[str, Any] = _LOG_TEMPLATES[level, evolved] if reuse else {}
+    _fill_base(log, level, *_draw_fields(level))
+    
+    # Add evolved fields for schema evolution demonstration
+    if evolved:
+        add_evolved_fields(log)
+
+    return log
+
+
+def _draw_fields(level: str) -> tuple[int, int, int, int, int, int, float, float, float]:
+    """Draw the random values _fill_base needs for one event of the given level.
+    
+    Returns (si, hi, mi, sti, duration, user_id, amount, coin_a, coin_b). The
+    batched generator draws the same values with NumPy.
+    """
+    # Select service and host (uniform over services, then over that service's hosts),
+    # then the level's message, status code and duration
+    si: int = int(_random() * len(_SERVICES_T))
+    hi: int = int(_random() * len(_HOSTS_T[si]))
+    mi: int = int(_random() * len(_LEVEL_MESSAGES[level]))
+    sti: int = int(_random() * len(STATUS_CODES[level]))
+    low, high = _LEVEL_DURATIONS[level]
+    return (si, hi, mi, sti, _randint(low, high), 10000 + int(_random() * 90000),
+            _uniform(9.99, 999.99), _random(), _random())
+
+
+def _info_extras(service: str, user_id: int, amount: float,
+                 coin_a: float, coin_b: float) -> tuple[int | None, float | None]:
+    """Decide the optional user_id and amount of an INFO event from two coin flips."""
+    return (user_id if coin_a < 0.7 else None,  # 70% chance of user_id
+            round(amount, 2) if coin_b < 0.3 and service == "payment-service" else None)
+
+
+def _fill_base(log: dict[str, Any], level: str, si: int, hi: int, mi: int, sti: int, duration: int,
+               user_id: int, amount: float, coin_a: float, coin_b: float) -> None:
+    """Fill the base schema fields of log from pre-drawn random values.
+    
+    Shared by generate_log_event and the batched generator so both produce
+    the same schema, key order and distributions. si and hi select the
+    service and host, mi and sti index the level's message and status code
+    pools, and coin_a and coin_b are uniform draws in [0, 1) that decide
+    which optional fields are set.
+    """
+    service: str = _SERVICES_T[si]
+    
+    # Generate base log structure with ALL base fields (11 total)
+    # Always initialize all base schema fields to ensure consistent schema
+    log["timestamp"] = _now_iso()
+    log["level"] = level
+    log["service"] = service
+    log["host"] = _HOSTS_T[si][hi]
+    log["request_id"] = f"req-{_getrandbits(32):08x}"
+    log["message"] = None
+    log["duration_ms"] = None
+    log["status_code"] = STATUS_CODES[level][sti]
+    log["user_id"] = None
+    log["amount"] = None
+    log["error"] = None
+    
+    # Add level-specific content
+    if level == "INFO":
+        log["message"] = INFO_MESSAGES[mi]
+        log["duration_ms"] = duration
+        info_user, log["amount"] = _info_extras(service, user_id, amount, coin_a, coin_b)
+        if info_user is not None:
+            log["user_id"] = f"user-{info_user}"
+            
+    elif level == "WARN":
+        log["message"] = WARN_MESSAGES[mi]
+        
+        # Duration_ms may or may not be present for WARN
+        if coin_a < 0.5:
+            log["duration_ms"] = duration
+        
+        # User_id may or may not be present for WARN
+        if coin_b < 0.4:
+            log["user_id"] = f"user-{user_id}"
+            
+    else:  # ERROR
+        log["message"], log["error"] = ERROR_MESSAGES[mi]
+        log["duration_ms"] = duration
+
+
+def add_evolved_fields(log: dict[str, Any]) -> None:
+    """Add evolved fields to a base log event for schema evolution demonstration.
+    
+    Initializes ALL evolved fields (26 total) to ensure consistent schema.
+    """
+    level: str = log["level"]
+    service: str = log["service"]
+    
+    # Initialize all evolved fields as None first
+    evolved_fields: dict[str, Any] = {
+        "region": None,
+        "trace_id": None,
+        "auth_method": None,
+        "provider": None,
+        "session_duration": None,
+        "currency": None,
+        "payment_method": None,
+        "retry_count": None,
+        "file_size_bytes": None,
+        "content_type": None,
+        "memory_percent": None,
+        "available_mb": None,
+        "disk_usage_percent": None,
+        "available_gb": None,
+        "query_params": None,
+        "result_count": None,
+        "recipient": None,
+        "smtp_code": None,
+        "metrics_count": None,
+        "time_window": None,
+        "product_id": None,
+        "rating": None,
+        "version": None,
+        "status": None,
+        "test": None,
+        "validation_errors": None
+    }
+    
+    # Add region to most logs
+    if _random() < 0.8:
+        regions = ["us-east-1", "us-west-2", "us-central-1", "eu-west-1", "eu-central-1", "ap-south-1", "ap-northeast-1"]
+        evolved_fields["region"] = _choice(regions)
+    
+    # Add trace_id occasionally
+    if _random() < 0.3:
+        evolved_fields["trace_id"] = f"trace-{_getrandbits(64):016x}"
+    
+    # Add auth-specific extended fields (higher probability for demo)
+    if service == "auth-service" and level == "INFO":
+        if _random() < 0.9:  # Increased from 0.6 to ensure demo queries return data
+            evolved_fields["auth_method"] = _choice(["oauth2", "saml", "basic", "api_key"])
+            evolved_fields["provider"] = _choice(["google", "okta", "azure", "aws"])
+            if _random() < 0.7:  # Increased from 0.5
+                evolved_fields["session_duration"] = _choice([1800, 3600, 7200])
+    
+    # Add payment-specific extended fields (higher probability for demo)
+    if service == "payment-service":
+        if log.get("amount") is not None or _random() < 0.6:  # Ensure payment logs get these fields
+            if log.get("amount") is None:
+                log["amount"] = round(_uniform(9.99, 999.99), 2)
+            if _random() < 0.9:  # Increased from 0.7 to ensure demo queries return data
+                evolved_fields["currency"] = _choice(["USD", "EUR", "GBP", "JPY"])
+                evolved_fields["payment_method"] = _choice(["credit_card", "debit_card", "paypal", "bank_transfer"])
+    
+    # Add retry count for errors
+    if level == "ERROR" and _random() < 0.5:
+        evolved_fields["retry_count"] = _randint(1, 5)
+    
+    # Add file upload fields for web-api (more scenarios)
+    if service == "web-api":
+        # Either the message contains "upload" OR randomly add for demo purposes
+        if "upload" in log.get("message", "").lower() or _random() < 0.3:
+            evolved_fields["file_size_bytes"] = _randint(10240, 10485760)  # 10KB to 10MB
+            evolved_fields["content_type"] = _choice(["image/jpeg", "image/png", "application/pdf", "text/csv"])
+    
+    # Add system metrics for warnings
+    if level == "WARN" and ("memory" in log["message"].lower() or "disk" in log["message"].lower()):
+        if "memory" in log["message"].lower():
+            evolved_fields["memory_percent"] = round(_uniform(80, 95), 1)
+            evolved_fields["available_mb"] = _randint(256, 1024)
+        if "disk" in log["message"].lower():
+            evolved_fields["disk_usage_percent"] = _randint(85, 98)
+            evolved_fields["available_gb"] = _randint(10, 100)
+    
+    # Add query params for search/web services
+    if service in ["web-api", "search-service"] and _random() < 0.3:
+        evolved_fields["query_params"] = {"category": _choice(["electronics", "books", "clothing"]), "limit": _choice([10, 25, 50, 100])}
+        evolved_fields["result_count"] = _randint(0, evolved_fields["query_params"]["limit"])
+    
+    # Add notification-specific fields
+    if service == "notification-service" and level == "ERROR":
+        if _random() < 0.5:
+            evolved_fields["recipient"] = f"user{_randint(1000, 9999)}@example.com"
+            evolved_fields["smtp_code"] = _choice([550, 554, 421])
+    
+    # Add analytics metrics
+    if service == "analytics-service" and "metrics" in log.get("message", "").lower():
+        if _random() < 0.6:
+            evolved_fields["metrics_count"] = _randint(100, 5000)
+            evolved_fields["time_window"] = _choice(["1h", "4h", "24h"])
+    
+    # Add web-api specific fields occasionally
+    if service == "web-api" and _random() < 0.2:
+        evolved_fields["product_id"] = f"prod-{_randint(10000, 99999)}"
+        evolved_fields["rating"] = _randint(1, 5)
+    
+    # Add version info occasionally
+    if _random() < 0.15:
+        evolved_fields["version"] = _choice(["1.0", "1.5", "2.0", "2.1"])
+    
+    # Add status field occasionally
+    if _random() < 0.1:
+        evolved_fields["status"] = _choice(["healthy", "degraded", "unhealthy"])
+    
+    # Add test flag occasionally
+    if _random() < 0.05:
+        evolved_fields["test"] = True
+    
+    # Add validation errors for some ERROR logs
+    if level == "ERROR" and "validation" in log.get("message", "").lower():
+        evolved_fields["validation_errors"] = ["missing_field", "invalid_format"]
+    
+    # Merge evolved fields into log
+    log.update(evolved_fields)
+
+
+def generate_log_events(count: int, evolved: bool = False, reuse: bool = False) -> Iterator[dict[str, Any]]:
+    """Generate count log events, drawing random values in NumPy batches.
+    
+    Produces the same schema and distributions as generate_log_event, but
+    draws levels, services, hosts, messages, durations and coin flips for a
+    whole batch of events at once. Falls back to generate_log_event when
+    NumPy is not installed. See generate_log_event for the reuse contract.
+    """
+    for _, log in _generate_records(count, evolved, reuse, False):
+        # With info_bytes=False every event is a dict
+        yield cast(dict[str, Any], log)
+
+
+def generate_log_records(count: int, evolved: bool = False,
+                         reuse: bool = False) -> Iterator[tuple[str, dict[str, Any] | bytes]]:
+    """Generate count (service, event) pairs ready for producing.
+    
+    Like generate_log_events, but base schema INFO events (the bulk of the
+    traffic) are returned as compact JSON bytes assembled from precomputed
+    fragments, skipping the dict and the generic JSON encoder. All other
+    events are returned as dicts and still need serializing.
+    """
+    return _generate_records(count, evolved, reuse, not evolved)
+
+
+def _info_payload(si: int, hi: int, mi: int, status_code: int, duration: int,
+                  user_id: int | None, amount: float | None) -> bytes:
+    """Serialize a base schema INFO event directly to JSON bytes."""
+    user: str = "null" if user_id is None else f'"user-{user_id}"'
+    amount_json: str = "null" if amount is None else repr(amount)
+    return (f'{{"timestamp":"{_now_iso()}{_INFO_HEADS[si][hi]}{_getrandbits(32):08x}",'
+            f'"message":{_INFO_MESSAGES_JSON[mi]},"duration_ms":{duration},"status_code":{status_code},'
+            f'"user_id":{user},"amount":{amount_json},"error":null}}').encode()
+
+
+def _generate_records(count: int, evolved: bool, reuse: bool,
+                      info_bytes: bool) -> Iterator[tuple[str, dict[str, Any] | bytes]]:
+    """Shared generator behind generate_log_events and generate_log_records."""
+    if np is None:
+        for _ in range(count):
+            level: str = choose_level()
+            if info_bytes and level == "INFO":
+                si, hi, mi, sti, duration, user_id, amount, coin_a, coin_b = _draw_fields(level)
+                service: str = _SERVICES_T[si]
+                info_user, info_amount = _info_extras(service, user_id, amount, coin_a, coin_b)
+                yield service, _info_payload(si, hi, mi, STATUS_CODES["INFO"][sti], duration,
+                                             info_user, info_amount)
+                continue
+            
+            log: dict[str, Any] = generate_log_event(evolved=evolved, reuse=reuse, level=level)
+            yield log["service"], log
+        return
+    
+    for batch_start in range(0, count, _NP_BATCH_SIZE):
+        n: int = min(_NP_BATCH_SIZE, count - batch_start)
+        
+        levels = _np_rng.choice(len(_LEVEL_ITEMS), size=n, p=_NP_LEVEL_P)
+        service_idx = _np_rng.integers(0, len(SERVICES), size=n)
+        host_idx = (_np_rng.random(n) * _NP_HOST_COUNTS[service_idx]).astype(np.intp)
+        message_idx = (_np_rng.random(n) * _NP_MESSAGE_COUNTS[levels]).astype(np.intp)
+        status_idx = (_np_rng.random(n) * _NP_STATUS_COUNTS[levels]).astype(np.intp)
+        durations = _np_rng.integers(_NP_DURATION_LOW[levels], _NP_DURATION_HIGH[levels])
+        user_ids = _np_rng.integers(10000, 100000, size=n)
+        amounts = _np_rng.uniform(9.99, 999.99, size=n)
+        coins = _np_rng.random(size=(n, 2))
+        
+        # Convert to native Python values so events stay JSON serializable
+        for level_i, si, hi, mi, sti, duration, user_id, amount, (coin_a, coin_b) in zip(
+                levels.tolist(), service_idx.tolist(), host_idx.tolist(), message_idx.tolist(),
+                status_idx.tolist(), durations.tolist(), user_ids.tolist(), amounts.tolist(),
+                coins.tolist()):
+            level = _LEVEL_ITEMS[level_i]
+            service = _SERVICES_T[si]
+            
+            if info_bytes and level == "INFO":
+                info_user, info_amount = _info_extras(service, user_id, amount, coin_a, coin_b)
+                yield service, _info_payload(si, hi, mi, STATUS_CODES["INFO"][sti], duration,
+                                             info_user, info_amount)
+                continue
+            
+            log = _LOG_TEMPLATES[level, evolved] if reuse else {}
+            _fill_base(log, level, si, hi, mi, sti, duration, user_id, amount, coin_a, coin_b)
+            
+            if evolved:
+                add_evolved_fields(log)
+            
+            yield service, log